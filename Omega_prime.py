@@ -15,15 +15,20 @@ Features:
 
 import os
 import re
+import csv
 import json
 import time
 import hashlib
 import sqlite3
+import queue
+import threading
+import subprocess
 import feedparser
 import requests
-import pandas as pd
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 # -------------------------- CONFIGURATION --------------------------
@@ -32,24 +37,215 @@ TELEGRAM_CHAT_ID   = os.getenv("TG_CHAT_ID")        # Optional
 DISCORD_WEBHOOK    = os.getenv("DISCORD_WEBHOOK")   # Optional
 GITHUB_REPO        = os.getenv("GITHUB_REPOSITORY") # Auto-filled in Actions
 
-# Scoring keywords (tunable)
-HIGH_VALUE_KEYWORDS = [
+# Shared pooled session — reuses TCP/TLS connections across feed fetches
+# and notifications instead of a fresh handshake per request
+_HTTP = requests.Session()
+_HTTP.headers.update({"User-Agent": "OmegaPrime/1.0"})
+_adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=1)
+_HTTP.mount("https://", _adapter)
+_HTTP.mount("http://", _adapter)
+
+# Scoring keywords (tunable) — tuples: built once, never mutated
+HIGH_VALUE_KEYWORDS = (
     "airdrop", "testnet", "incentive", "reward", "points", "faucet",
     "retroactive", "grant", "bounty", "quest", "galxe", "layer3",
     "zealy", "crew3", "taskon", "guild.xyz", "pre-tge", "mainnet soon"
-]
-
-URGENT_KEYWORDS = ["24h", "48h", "ends soon", "last chance", "deadline"]
+)
+
+URGENT_KEYWORDS = ("24h", "48h", "ends soon", "last chance", "deadline")
+
+# Specific project boosts (2025 hot ones)
+HOT_PROJECTS = ("zksync", "scroll", "linea", "blast", "taiko", "eigenlayer", "zircuit", "berachain", "monad")
+
+# Byte-level mirrors of the buckets plus an A-Z→a-z table: feed text is
+# almost always ASCII, and bytes.translate + bytes.count skip the Unicode
+# lower()/FASTSEARCH codepaths entirely
+_HV_BYTES = tuple(kw.encode() for kw in HIGH_VALUE_KEYWORDS)
+_URG_BYTES = tuple(kw.encode() for kw in URGENT_KEYWORDS)
+_HOT_BYTES = tuple(kw.encode() for kw in HOT_PROJECTS)
+_TOLOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# Optional Numba fast path: a byte-level scan LLVM can vectorize, keeping the
+# interpreter out of the inner loop. Purely opportunistic — the bot stays
+# zero-dependency-beyond-the-basics and falls back to the regex pass.
+try:
+    import numpy as np
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _count_hits(text, kw_buf, kw_offsets):
+        total = 0
+        for k in range(len(kw_offsets) - 1):
+            start = kw_offsets[k]
+            klen = kw_offsets[k + 1] - start
+            first = kw_buf[start]
+            for i in range(len(text) - klen + 1):
+                if text[i] != first:
+                    continue
+                j = 1
+                while j < klen and text[i + j] == kw_buf[start + j]:
+                    j += 1
+                if j == klen:
+                    total += 1
+        return total
+
+    def _pack_keywords(keywords):
+        buf = np.frombuffer("".join(keywords).encode(), dtype=np.uint8)
+        offsets = np.cumsum([0] + [len(k) for k in keywords]).astype(np.int64)
+        return buf, offsets
+
+    _HV_PACKED = _pack_keywords(HIGH_VALUE_KEYWORDS)
+    _URG_PACKED = _pack_keywords(URGENT_KEYWORDS)
+    _HOT_PACKED = _pack_keywords(HOT_PROJECTS)
+
+# Compiled once — calculate_score runs per entry and re.search's per-call
+# cache lookup (and possible LRU eviction) adds up
+_DEADLINE_RE = re.compile(
+    r'(ends?|deadline|closes?).{0,30}(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{1,2}[\/\-]\d{1,2})',
+    re.IGNORECASE
+)
 
 # -------------------------- DATABASE SETUP --------------------------
 DB_FILE = "opportunities.db"
 CSV_FILE = "opportunities.csv"
 
+# One long-lived connection shared by the fetch worker threads; the lock
+# serializes writes (sqlite allows one writer at a time anyway)
+_CONN: Optional[sqlite3.Connection] = None
+_DB_LOCK = threading.Lock()
+
+# Ids already in the DB, loaded once at startup — feeds mostly repeat, so
+# dupes get filtered here without touching sqlite at all. With pybloom-live
+# installed, a bloom filter (~10 bits/id) stands in for the hex-string set
+# (~80 bytes/id); a bloom hit can be a false positive, so it falls back to
+# an authoritative sqlite lookup.
+try:
+    from pybloom_live import ScalableBloomFilter
+    _HAS_BLOOM = True
+except ImportError:
+    _HAS_BLOOM = False
+
+_SEEN: set = set()
+_BLOOM = None
+
+# Per-scan :memory: staging DB; merged into the disk DB in one transaction
+# at the end of the cycle so a whole scan costs a single fsync
+_STAGE: Optional[sqlite3.Connection] = None
+
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    global _CONN
+    if _CONN is not None:
+        # Already initialized — keep the persistent connection and the
+        # seen-id state alive across main_loop cycles
+        return
+    _CONN = sqlite3.connect(DB_FILE, check_same_thread=False)
+    cursor = _CONN.cursor()
+    # WAL + NORMAL: one small log append per commit instead of full fsyncs
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS opportunities (
+            id TEXT PRIMARY KEY,   -- 32-char blake2b hex of the link
+            title TEXT,
+            link TEXT,
+            source TEXT,
+            published TEXT,
+            score REAL,
+            deadline_hint TEXT,
+            notified INTEGER DEFAULT 0,
+            added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    # export_to_csv orders by these on every cycle
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_score ON opportunities(score DESC, added_at DESC)")
+    # HTTP validators per feed so unchanged feeds answer 304 with no body
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feed_meta (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            modified TEXT
+        )
+    ''')
+    _CONN.commit()
+
+    global _SEEN, _BLOOM
+    if _HAS_BLOOM:
+        _BLOOM = ScalableBloomFilter(initial_capacity=1_000_000, error_rate=0.001)
+        for row in cursor.execute("SELECT id FROM opportunities"):
+            _BLOOM.add(row[0])
+    else:
+        _SEEN = {row[0] for row in cursor.execute("SELECT id FROM opportunities")}
+
+def _already_seen(entry_id: str) -> bool:
+    """Dedup check; marks the id as seen when it wasn't. Caller holds _DB_LOCK."""
+    if _HAS_BLOOM:
+        if entry_id not in _BLOOM:
+            _BLOOM.add(entry_id)
+            return False
+        # Possible bloom false positive — confirm against disk and this
+        # cycle's staged rows before declaring it a dupe
+        if _CONN.execute("SELECT 1 FROM opportunities WHERE id = ?", (entry_id,)).fetchone():
+            return True
+        if _STAGE is not None and _STAGE.execute("SELECT 1 FROM staged WHERE id = ?", (entry_id,)).fetchone():
+            return True
+        return False
+    if entry_id in _SEEN:
+        return True
+    _SEEN.add(entry_id)
+    return False
+
+def save_to_db(entries: List[Dict]) -> List[Dict]:
+    """Stage a feed's entries for the end-of-scan merge. Returns the new ones."""
+    if not entries:
+        return []
+
+    rows = []
+    new_entries = []
+    # Rows aren't staged until after the loop, so the bloom path can't see
+    # them yet — track this batch's ids so one link twice in a feed still
+    # counts once
+    batch_ids = set()
+    with _DB_LOCK:
+        for entry in entries:
+            # Dedup key, not a security boundary — blake2b/16 is faster than
+            # sha256 on short strings and halves the primary-key index size
+            entry_id = hashlib.blake2b(entry["link"].encode("utf-8"), digest_size=16).hexdigest()
+            if entry_id in batch_ids or _already_seen(entry_id):
+                continue
+            batch_ids.add(entry_id)
+            rows.append((
+                entry_id,
+                entry["title"][:200],
+                entry["link"],
+                entry["source"],
+                entry["published"],
+                entry["score"],
+                entry.get("deadline_hint", "")
+            ))
+            new_entries.append(entry)
+
+        if rows:
+            _STAGE.executemany('''
+                INSERT OR IGNORE INTO staged
+                (id, title, link, source, published, score, deadline_hint)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+
+    return new_entries
+
+def begin_scan():
+    """Open the in-memory staging table for one scan cycle."""
+    global _STAGE
+    _STAGE = sqlite3.connect(":memory:")
+    _STAGE.execute('''
+        CREATE TABLE staged (
             id TEXT PRIMARY KEY,
             title TEXT,
             link TEXT,
@@ -61,63 +257,73 @@ def init_db():
             added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
-    conn.commit()
-    conn.close()
 
-def save_to_db(entry: Dict):
-    entry_id = hashlib.sha256(entry["link"].encode()).hexdigest()
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        INSERT OR IGNORE INTO opportunities 
-        (id, title, link, source, published, score, deadline_hint)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        entry_id,
-        entry["title"][:200],
-        entry["link"],
-        entry["source"],
-        entry["published"],
-        entry["score"],
-        entry.get("deadline_hint", "")
-    ))
-    conn.commit()
-    notified = cursor.execute("SELECT notified FROM opportunities WHERE id = ?", (entry_id,)).fetchone()[0] == 0
-    conn.close()
-    return notified  # True if new and not notified yet
+def flush_scan():
+    """Merge everything staged this cycle into the disk DB — one commit."""
+    global _STAGE
+    with _DB_LOCK:
+        _STAGE.execute(f"ATTACH DATABASE '{DB_FILE}' AS disk")
+        _STAGE.execute("INSERT OR IGNORE INTO disk.opportunities SELECT * FROM staged")
+        _STAGE.commit()
+        _STAGE.close()
+        _STAGE = None
+
+def load_feed_meta(url: str):
+    with _DB_LOCK:
+        row = _CONN.execute("SELECT etag, modified FROM feed_meta WHERE url = ?", (url,)).fetchone()
+    return row if row else (None, None)
+
+def save_feed_meta(url: str, etag: Optional[str], modified: Optional[str]):
+    if not etag and not modified:
+        return
+    with _DB_LOCK:
+        _CONN.execute(
+            "INSERT OR REPLACE INTO feed_meta (url, etag, modified) VALUES (?, ?, ?)",
+            (url, etag, modified)
+        )
+        _CONN.commit()
 
 def export_to_csv():
-    conn = sqlite3.connect(DB_FILE)
-    df = pd.read_sql_query("SELECT * FROM opportunities ORDER BY score DESC, added_at DESC", conn)
-    conn.close()
-    df.to_csv(CSV_FILE, index=False)
+    # Stream straight from sqlite — no point materializing a DataFrame
+    cursor = _CONN.execute("SELECT * FROM opportunities ORDER BY score DESC, added_at DESC")
+    with open(CSV_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([col[0] for col in cursor.description])
+        writer.writerows(cursor)
 
 # -------------------------- SCORING ENGINE --------------------------
-def calculate_score(title: str, summary: str = "") -> float:
-    text = (title + " " + summary).lower()
-    score = 0.0
-
-    # Base keyword hits
-    for kw in HIGH_VALUE_KEYWORDS:
-        if kw in text:
-            score += 10.0
-
-    # Urgency boost
-    for kw in URGENT_KEYWORDS:
-        if kw in text:
-            score += 25.0
-
-    # Specific project boosts (2025 hot ones)
-    hot_projects = ["zksync", "scroll", "linea", "blast", "taiko", "eigenlayer", "zircuit", "berachain", "monad"]
-    for proj in hot_projects:
-        if proj in text:
-            score += 20.0
+def normalize_text(title: str, summary: str = "") -> str:
+    """Lowercase title+summary once so every downstream pass can share it."""
+    raw = title + " " + summary
+    if raw.isascii():
+        # ASCII fast path: table lookup per byte beats str.lower()'s
+        # Unicode machinery, and decoding back is a straight copy
+        return raw.encode().translate(_TOLOWER).decode()
+    return raw.lower()
+
+def calculate_score(text_lower: str) -> float:
+    text_b = text_lower.encode()
+
+    # Keyword hits, urgency boost and hot-project boost in one scan each
+    if _HAS_NUMBA:
+        # All keywords are ASCII, so scanning UTF-8 bytes cannot false-match
+        arr = np.frombuffer(text_b, dtype=np.uint8)
+        score = (10.0 * _count_hits(arr, *_HV_PACKED)
+                 + 25.0 * _count_hits(arr, *_URG_PACKED)
+                 + 20.0 * _count_hits(arr, *_HOT_PACKED))
+    else:
+        # bytes.count hands back the multiplicity directly — no match-object
+        # or result-list allocation like re.findall
+        score = (10.0 * sum(text_b.count(kw) for kw in _HV_BYTES)
+                 + 25.0 * sum(text_b.count(kw) for kw in _URG_BYTES)
+                 + 20.0 * sum(text_b.count(kw) for kw in _HOT_BYTES))
 
     # Deadline extraction (very rough but works)
-    deadline_match = re.search(r'(ends?|deadline|closes?).{0,30}(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{1,2}[\/\-]\d{1,2})', text, re.I)
+    deadline_match = _DEADLINE_RE.search(text_lower)
     deadline_hint = deadline_match.group(0) if deadline_match else ""
 
-    return round(score, 2), deadline_hint
+    # No round(): every addend is an exactly representable float
+    return score, deadline_hint
 
 # -------------------------- NOTIFICATIONS --------------------------
 def send_telegram(message: str):
@@ -126,7 +332,7 @@ def send_telegram(message: str):
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
     payload = {"chat_id": TELEGRAM_CHAT_ID, "text": message, "parse_mode": "HTML", "disable_web_page_preview": True}
     try:
-        requests.post(url, data=payload, timeout=10)
+        _HTTP.post(url, data=payload, timeout=10)
     except:
         pass
 
@@ -134,25 +340,38 @@ def send_discord(message: str):
     if not DISCORD_WEBHOOK:
         return
     try:
-        requests.post(DISCORD_WEBHOOK, json={"content": message}, timeout=10)
+        _HTTP.post(DISCORD_WEBHOOK, json={"content": message}, timeout=10)
     except:
         pass
 
-def notify(entry: Dict):
-    message = f"""
+# Notifications are fire-and-forget: queue them and let one background
+# thread pay the webhook round-trips, so the ingest loop never blocks
+_NOTIFY_Q: queue.Queue = queue.Queue()
+
+def _notify_worker():
+    while True:
+        entry = _NOTIFY_Q.get()
+        try:
+            message = f"""
 🚀 <b>NEW HIGH-SCORE OPPORTUNITY</b> | Score: {entry['score']}
 
 📌 <b>{entry['title']}</b>
 🔗 {entry['link']}
 🗓 {entry.get('deadline_hint', 'No deadline hint')}
 📡 Source: {entry['source']}
-    """.strip()
+            """.strip()
+            send_telegram(message)
+            send_discord(message)
+        finally:
+            _NOTIFY_Q.task_done()
 
-    send_telegram(message)
-    send_discord(message)
+threading.Thread(target=_notify_worker, daemon=True).start()
+
+def notify(entry: Dict):
+    _NOTIFY_Q.put(entry)
 
 # -------------------------- FEED SOURCES (2025) --------------------------
-FEEDS = [
+RSS_FEEDS = (
     {"name": "AirdropAlert RSS", "url": "https://airdropalert.com/rss"},
     {"name": "Binance Academy", "url": "https://academy.binance.com/en/articles.rss"},
     {"name": "CoinList Announcements", "url": "https://coinlist.co/rss"},
@@ -161,60 +380,173 @@ FEEDS = [
     {"name": "CryptoRank Airdrops", "url": "https://cryptorank.io/feed"},
     {"name": "Galxe Quest Feed", "url": "https://galxe.com/feed"},  # unofficial, works via RSSHub
     {"name": "Layer3 Quests", "url": "https://layer3.xyz/feed"},   # unofficial
-]
+)
 
-# Add free Nitter/Twitter RSS via RSSHub (no auth needed)
-TWITTER_USERS = [
+# Free Nitter/Twitter RSS via RSSHub (no auth needed)
+TWITTER_USERS = (
     "airdropinspect", "dropstoken", "gem_insider", "defi_airdrops",
     "ItsAlwaysZonny", "starrynift", "0xNonceSense"
-]
+)
 
-for user in TWITTER_USERS:
-    FEEDS.append({
-        "name": f"Twitter @{user}",
-        "url": f"https://rsshub.app/twitter/user/{user}/exclude_replies"
-    })
+# Built in one shot and frozen — nothing mutates the feed list after import
+FEEDS = RSS_FEEDS + tuple(
+    {"name": f"Twitter @{user}", "url": f"https://rsshub.app/twitter/user/{user}/exclude_replies"}
+    for user in TWITTER_USERS
+)
 
 # -------------------------- CORE LOOP --------------------------
-def process_feed(feed: Dict):
+MAX_ENTRIES_PER_FEED = 15
+
+def parse_feed_entries(content: bytes) -> List[Dict]:
+    """Extract title/link/summary/published from raw RSS or Atom bytes.
+
+    We only need four fields from the newest entries, so parse with lxml
+    (libxml2, C) and skip feedparser's relative-URI resolution and HTML
+    sanitization — by far its most expensive steps on large feeds.
+    """
+    root = etree.fromstring(content, parser=etree.XMLParser(recover=True, huge_tree=False))
+    if root is None:
+        raise ValueError("unparseable feed")
+
+    is_atom = root.tag.endswith("feed")
+    nodes = root.iterfind(".//{*}entry") if is_atom else root.iterfind(".//{*}item")
+
+    entries = []
+    for node in nodes:
+        title = node.findtext("{*}title") or ""
+        if is_atom:
+            link_el = node.find("{*}link")
+            link = (link_el.get("href") if link_el is not None else None) or node.findtext("{*}link")
+            summary = node.findtext("{*}summary") or node.findtext("{*}content") or ""
+            published = node.findtext("{*}published") or node.findtext("{*}updated")
+        else:
+            link = node.findtext("{*}link")
+            summary = node.findtext("{*}description") or ""
+            published = node.findtext("{*}pubDate")
+
+        if not link:
+            continue
+        entries.append({
+            "title": title,
+            "link": link,
+            "summary": summary,
+            "published": published or str(datetime.now())
+        })
+        if len(entries) >= MAX_ENTRIES_PER_FEED:
+            break
+    return entries
+
+def fetch_feed(feed: Dict) -> Optional[Tuple[bytes, Optional[str], Optional[str]]]:
+    """Stage 1 (threads): download the raw feed bytes, or None if unchanged.
+
+    Returns (content, etag, last_modified); the validators are persisted by
+    the caller only after the feed's entries are stored, so a cycle that
+    fails mid-pipeline retries the same content next time instead of being
+    304'd past it.
+    """
     try:
-        d = feedparser.parse(feed["url"], request_headers={'User-Agent': 'OmegaPrime/1.0'})
-        for entry in d.entries[:15]:  # newest first
-            title = entry.title
-            link = entry.link
-            summary = entry.get("summary", "")
-            published = entry.get("published", str(datetime.now()))
+        # Send last cycle's validators so unchanged feeds come back 304
+        etag, modified = load_feed_meta(feed["url"])
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+        resp = _HTTP.get(feed["url"], timeout=10, headers=headers)
+        if resp.status_code == 304:
+            return None  # nothing new since last scan
+        if resp.status_code != 200:
+            # Error pages can carry validators too — don't cache those
+            logging.error(f"Error fetching {feed['name']}: HTTP {resp.status_code}")
+            return None
+        return resp.content, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    except Exception as e:
+        logging.error(f"Error fetching {feed['name']}: {e}")
+        return None
 
-            score, deadline_hint = calculate_score(title, summary)
+def parse_feed_content(content: bytes) -> List[Dict]:
+    """Stage 2 (worker processes): raw bytes -> entry dicts. Top level so
+    ProcessPoolExecutor can pickle it."""
+    try:
+        return parse_feed_entries(content)
+    except Exception:
+        # feedparser tolerates worse markup — keep it as the slow path.
+        # Bozo entries can lack title/link, so mirror parse_feed_entries:
+        # default the rest, skip anything without a link.
+        d = feedparser.parse(content)
+        return [{
+            "title": e.get("title", ""),
+            "link": e.get("link"),
+            "summary": e.get("summary", ""),
+            "published": e.get("published", str(datetime.now()))
+        } for e in d.entries[:MAX_ENTRIES_PER_FEED] if e.get("link")]
+
+def score_and_store(feed: Dict, parsed: List[Dict]) -> bool:
+    """Stage 3 (main thread): score, persist and notify a feed's entries.
+
+    Returns True when the feed was fully processed.
+    """
+    try:
+        opportunities = []
+        for entry in parsed:  # newest first
+            text_lower = normalize_text(entry["title"], entry["summary"])
+            score, deadline_hint = calculate_score(text_lower)
 
             if score < 15:  # filter noise
                 continue
 
-            opp = {
-                "title": title,
-                "link": link,
+            opportunities.append({
+                "title": entry["title"],
+                "link": entry["link"],
                 "source": feed["name"],
-                "published": published,
+                "published": entry["published"],
                 "score": score,
-                "deadline_hint": deadline_hint
-            }
+                "deadline_hint": deadline_hint,
+                "text_lower": text_lower  # reusable by later analyzers
+            })
 
-            if save_to_db(opp):
-                notify(opp)
-                logging.info(f"New high-score: {score} — {title}")
+        # Staged in memory; flush_scan commits the whole cycle at once
+        for opp in save_to_db(opportunities):
+            notify(opp)
+            logging.info(f"New high-score: {opp['score']} — {opp['title']}")
+        return True
 
     except Exception as e:
-        logging.error(f"Error parsing {feed['name']}: {e}")
+        logging.error(f"Error processing {feed['name']}: {e}")
+        return False
 
 def run_once():
     logging.basicConfig(level=logging.INFO)
     init_db()
 
-    logging.info("OMEGA-PRIME started scanning...")
-    for feed in FEEDS:
-        process_feed(feed)
-        time.sleep(1)  # Be nice
+    begin_scan()
 
+    logging.info("OMEGA-PRIME started scanning...")
+    # Pipeline: threads overlap the network I/O, worker processes overlap
+    # the (GIL-bound) parsing, and the main thread owns sqlite
+    with ThreadPoolExecutor(max_workers=min(16, len(FEEDS))) as executor:
+        fetched = list(executor.map(fetch_feed, FEEDS))
+
+    changed = [(feed, result) for feed, result in zip(FEEDS, fetched) if result]
+    if changed:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = {pool.submit(parse_feed_content, content): (feed, etag, modified)
+                       for feed, (content, etag, modified) in changed}
+            for future in as_completed(futures):
+                feed, etag, modified = futures[future]
+                try:
+                    parsed = future.result()
+                except Exception as e:
+                    # One bad feed (or a broken worker) must not lose the
+                    # whole cycle's staged rows
+                    logging.error(f"Error parsing {feed['name']}: {e}")
+                    continue
+                if score_and_store(feed, parsed):
+                    # Only now is the feed safe to 304 next cycle
+                    save_feed_meta(feed["url"], etag, modified)
+
+    flush_scan()
+    _NOTIFY_Q.join()  # flush pending notifications before we report done
     export_to_csv()
     logging.info("Scan complete. CSV updated.")
 
@@ -229,12 +561,16 @@ def github_commit_and_push():
     if not os.getenv("GITHUB_ACTIONS"):
         return
 
+    # List argv, no shell hop; identity passed inline via -c instead of
+    # mutating global git config
+    git = ["git", "-c", "user.email=omega-prime@bot.com", "-c", "user.name=OMEGA-PRIME"]
     try:
-        os.system("git config --global user.email 'omega-prime@bot.com'")
-        os.system("git config --global user.name 'OMEGA-PRIME'")
-        os.system("git add opportunities.db opportunities.csv")
-        os.system('git commit -m "feat: update opportunities [auto]" || echo "No changes"')
-        os.system("git push")
+        subprocess.run(git + ["add", "opportunities.db", "opportunities.csv"], check=False)
+        result = subprocess.run(git + ["commit", "-m", "feat: update opportunities [auto]"], check=False)
+        if result.returncode != 0:
+            logging.info("No changes to commit")
+            return
+        subprocess.run(git + ["push"], check=False)
     except:
         pass
 